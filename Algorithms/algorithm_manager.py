@@ -5,6 +5,7 @@ from Algorithms.alpha_beta import Alpha_Beta_Algorithm
 from Algorithms.algorithm import Algorithm
 from Algorithms.Util.board import Board
 from Algorithms.minimax_tt import MinimaxWithTranspositionTable
+from Engine.position_db import PositionDB
 
 class Algorithm_Types(Enum):
     RAND = 0
@@ -21,6 +22,7 @@ class Algorithm_Manager:
         self.debug_mode = is_debug
         self.current_algorithm = Random_Algorithm(0, 0)
         self.minimax_tt = MinimaxWithTranspositionTable()
+        self.position_db = None
 
     def set_algorithm(self, type: Algorithm_Types, max_search_depth, max_time_limit):
         if (type == Algorithm_Types.RAND):
@@ -38,5 +40,13 @@ class Algorithm_Manager:
     def set_evaluation_function():
         pass
 
+    # Known positions (e.g. an opening book) are answered before searching
+    def load_position_db(self, path):
+        self.position_db = PositionDB(path)
+
     def make_move(self, b: Board) -> tuple[int, int]:
+        if self.position_db is not None:
+            hit = self.position_db.probe_grid(b.grid)
+            if hit is not None:
+                return hit
         return self.current_algorithm.make_move(b, self.debug_mode)
\ No newline at end of file
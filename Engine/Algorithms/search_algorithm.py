@@ -1,10 +1,39 @@
 from Engine.search_engine import SearchEngine
 from Engine.search_context import SearchContext
+from Engine.parallel_search import LazySMP, RootSplitter
 
 class SearchAlgo:
     def __init__(self, ctx: SearchContext):
         self.engine = SearchEngine()
         self.ctx = ctx
+        # Helper processes for Lazy SMP, kept alive between moves
+        self.smp = LazySMP(ctx) if ctx.smp_workers > 0 else None
+        if ctx.root_workers > 0:
+            ctx.root_splitter = RootSplitter(ctx)
 
     def make_move(self, board, debug):
-        return self.engine.make_move(board, self.ctx)
+        if self.ctx.book is not None:
+            hit = self.ctx.book.probe(board)
+            if hit is not None:
+                if debug: print(f"Book move {hit[0]} (score {hit[1]})")
+                return hit
+        if self.smp is not None:
+            result = self.smp.make_move(board)
+        else:
+            result = self.engine.make_move(board, self.ctx)
+        if debug:
+            print(self.stats.report())
+        return result
+
+    @property
+    def stats(self):
+        """SearchStats of the last searched move"""
+        return self.ctx.stats
+
+    def close(self):
+        if self.smp is not None:
+            self.smp.close()
+            self.smp = None
+        if self.ctx.root_splitter is not None:
+            self.ctx.root_splitter.close()
+            self.ctx.root_splitter = None
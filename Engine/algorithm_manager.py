@@ -1,9 +1,12 @@
+import atexit
 from enum import Enum
 from Engine.search_context import SearchContext
 from Engine.search_engine import SearchEngine
+from Engine.transposition_table import TranspositionTable, SharedTranspositionTable
 
 from Engine.board import Board
 from Engine.evaluation import evaluate
+from Engine.position_db import PositionDB
 from Engine.Algorithms.random_algorithm import RandomAlgo
 from Engine.Algorithms.search_algorithm import SearchAlgo
 
@@ -17,20 +20,51 @@ class Algorithm_Types(Enum):
     ITERDEEP = 4
     ITERDEEPTT = 5
     ITERDEEPMOVEORDER = 6
+    ITERDEEPPVS = 7
+    SOLVER = 8
 
 
 class Algorithm_Manager:
+    """
+    Picks and runs the search for the game. Helper processes and shared
+    tables are released by shutdown(), which also runs at interpreter exit;
+    the manager can be used as a context manager to release them sooner.
+    """
     def __init__(self, debug):
         self.debug_mode = debug
         self.current_algorithm = RandomAlgo()
+        # Shared by every search context this manager builds, so it persists across moves and games
+        self.tt = None
+        self.book = None
+        atexit.register(self.shutdown)
 
-    def set_algorithm(self, type: Algorithm_Types, max_depth, max_time):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def set_algorithm(self, type: Algorithm_Types, max_depth, max_time, workers=0):
+        """
+        'workers' > 0 adds that many Lazy SMP helper processes to the
+        iterative deepening types that use the transposition table, and
+        splits the root moves over a pool of that many processes for the
+        types without one.
+        """
+        self.close()
         if type == Algorithm_Types.RAND:
             self.current_algorithm = RandomAlgo()
             return
 
+        smp = workers > 0 and type in (Algorithm_Types.ITERDEEPTT,
+                                       Algorithm_Types.ITERDEEPMOVEORDER,
+                                       Algorithm_Types.ITERDEEPPVS)
+        if self.tt is None or (smp and not isinstance(self.tt, SharedTranspositionTable)):
+            self.close_tt()
+            self.tt = SharedTranspositionTable() if smp else TranspositionTable()
+
         # Build a fresh search context
-        ctx = SearchContext()
+        ctx = SearchContext(tt=self.tt, book=self.book)
         ctx.eval_func = evaluate
         ctx.max_depth = max_depth
         ctx.time_limit = max_time
@@ -67,8 +101,64 @@ class Algorithm_Manager:
             ctx.use_id = True
             ctx.use_move_ordering = True  # PV ordering + center ordering
 
+        elif type == Algorithm_Types.ITERDEEPPVS:
+            ctx.use_ab = True
+            ctx.use_tt = True
+            ctx.use_id = True
+            ctx.use_move_ordering = True
+            ctx.use_pvs = True  # negamax + PVS on top of the above
+
+        elif type == Algorithm_Types.SOLVER:
+            ctx.use_tt = True
+            ctx.use_solver = True  # exact score, max_depth unused
+
+        if smp:
+            ctx.smp_workers = workers
+        elif workers > 0 and type in (Algorithm_Types.MINIMAX,
+                                      Algorithm_Types.ABPRUNING,
+                                      Algorithm_Types.ITERDEEP):
+            ctx.root_workers = workers
+
         # Attach unified search algorithm
         self.current_algorithm = SearchAlgo(ctx)
 
     def make_move(self, board: Board):
         return self.current_algorithm.make_move(board, self.debug_mode)
+
+    def close(self):
+        """Stop any helper processes of the current algorithm"""
+        if isinstance(self.current_algorithm, SearchAlgo):
+            self.current_algorithm.close()
+
+    def shutdown(self):
+        """Stop helper processes, then release the transposition table"""
+        self.close()
+        self.close_tt()
+        atexit.unregister(self.shutdown)
+
+    def close_tt(self):
+        """Release the table's shared memory or file mapping"""
+        if self.tt is not None:
+            self.tt.close()
+        self.tt = None
+
+    def save_tt(self, path):
+        """Dump the transposition table so a later process can load_tt() it"""
+        if self.tt is not None:
+            self.tt.dump(path)
+
+    def load_book(self, path):
+        """
+        Consult a position database (e.g. an opening book built by
+        Engine.opening_book) before searching; call before set_algorithm
+        """
+        self.book = PositionDB(path)
+
+    def load_tt(self, path):
+        """
+        Start from a table written by save_tt(); call before set_algorithm.
+        Lazy SMP still swaps in an empty shared table.
+        """
+        self.close()
+        self.close_tt()
+        self.tt = TranspositionTable.load(path)
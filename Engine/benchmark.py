@@ -0,0 +1,177 @@
+# Engine/benchmark.py
+# Throughput and accuracy of one Algorithm_Types configuration over the
+# test_data suites.
+#
+# usage: python -m Engine.benchmark [--algorithm N] [--depth D] [--time T]
+#                                   [--limit N] [--warm] [--workers W]
+#                                   [--jsonl FILE] test_data/Test_L1_R1 ...
+#
+# Every position is searched from cold tables (unless --warm) and timed on
+# its own. A result counts as correct when it matches the expected score:
+# exactly for the SOLVER type, otherwise in sign (win / draw / loss), as
+# heuristic scores are on a different scale.
+#
+# With --workers the positions are shared out over a process pool, each
+# worker keeping one engine and context for its whole run. Per-position
+# results stream to --jsonl ("-" for stdout) as they complete; summaries
+# are computed from the results in suite order, so apart from the timing
+# figures they do not depend on the worker count (given cold tables and
+# a search that is not cut short by the clock).
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import Engine.config_constants as cc
+from Engine.algorithm_manager import Algorithm_Manager, Algorithm_Types
+from Engine.board import board_from_moves
+from Engine.solve_test_data import load_positions
+
+def make_manager(algorithm: Algorithm_Types, depth, time_limit):
+    manager = Algorithm_Manager(False)
+    manager.set_algorithm(algorithm, depth, time_limit)
+    return manager
+
+def reset_tables(manager: Algorithm_Manager):
+    """Empty every table the current algorithm would carry between positions."""
+    ctx = getattr(manager.current_algorithm, "ctx", None)
+    if ctx is not None:
+        ctx.clear_tables()
+
+def score_correct(score, expected, exact):
+    if score is None:
+        return False
+    if exact:
+        return score == expected
+    return (score > 0) - (score < 0) == (expected > 0) - (expected < 0)
+
+def run_position(manager: Algorithm_Manager, moves, expected, exact, warm=False):
+    """Search one position; returns a result record (a dict)."""
+    if not warm:
+        reset_tables(manager)
+    board = board_from_moves(moves)
+    start = time.perf_counter()
+    move, score = manager.make_move(board)
+    elapsed = time.perf_counter() - start
+    ctx = getattr(manager.current_algorithm, "ctx", None)
+    return {
+        "moves": moves,
+        "expected": expected,
+        "move": move,
+        "score": score,
+        "time": elapsed,
+        "nodes": ctx.nodes if ctx is not None else 0,
+        "correct": score_correct(score, expected, exact),
+    }
+
+def summarize(suite, results):
+    """Per-suite statistics from a list of run_position records."""
+    times = np.array([r["time"] for r in results], dtype=float)
+    nodes = np.array([r["nodes"] for r in results], dtype=float)
+    total_time = times.sum()
+    return {
+        "suite": suite,
+        "positions": len(results),
+        "mean_time": times.mean() if len(results) else 0.0,
+        "p50_time": np.percentile(times, 50) if len(results) else 0.0,
+        "p95_time": np.percentile(times, 95) if len(results) else 0.0,
+        "p99_time": np.percentile(times, 99) if len(results) else 0.0,
+        "mean_nodes": nodes.mean() if len(results) else 0.0,
+        "nodes_per_second": nodes.sum() / total_time if total_time > 0 else 0.0,
+        "correct_rate": sum(r["correct"] for r in results) / len(results) if results else 0.0,
+    }
+
+def format_summary(s):
+    return (f"{s['suite']}: {s['positions']} positions, "
+            f"mean {s['mean_time'] * 1000:.1f}ms, p50 {s['p50_time'] * 1000:.1f}ms, "
+            f"p95 {s['p95_time'] * 1000:.1f}ms, p99 {s['p99_time'] * 1000:.1f}ms, "
+            f"{s['mean_nodes']:.0f} nodes/position, {s['nodes_per_second']:.0f} nodes/s, "
+            f"{s['correct_rate'] * 100:.1f}% correct")
+
+# Per-process state: one warm manager (engine and context) per worker
+_manager = None
+_exact = False
+_warm = False
+
+def _init_worker(algorithm, depth, time_limit, warm):
+    global _manager, _exact, _warm
+    _manager = make_manager(algorithm, depth, time_limit)
+    _exact = algorithm == Algorithm_Types.SOLVER
+    _warm = warm
+
+def _run_task(task):
+    suite, index, moves, expected = task
+    record = run_position(_manager, moves, expected, _exact, _warm)
+    record["suite"] = suite
+    record["index"] = index
+    return record
+
+def benchmark_tasks(files, limit=None):
+    """(suite, index, moves, expected) for every position to run."""
+    return [(path, i, moves, expected)
+            for path in files
+            for i, (moves, expected) in enumerate(load_positions(path)[:limit])]
+
+def run_tasks(tasks, algorithm, depth, time_limit, warm=False, workers=1):
+    """Yield result records as they complete, over 'workers' processes."""
+    if workers <= 1:
+        _init_worker(algorithm, depth, time_limit, warm)
+        for task in tasks:
+            yield _run_task(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(algorithm, depth, time_limit, warm)) as pool:
+        for future in as_completed([pool.submit(_run_task, task) for task in tasks]):
+            yield future.result()
+
+def benchmark(files, algorithm, depth, time_limit, limit=None, warm=False, workers=1, stream=None):
+    """
+    Run every position of 'files' and return one summary per file, in
+    order. Each record is written to 'stream' as a JSON line on arrival.
+    """
+    results = {path: [] for path in files}
+    for record in run_tasks(benchmark_tasks(files, limit), algorithm, depth, time_limit, warm, workers):
+        results[record["suite"]].append(record)
+        if stream is not None:
+            stream.write(json.dumps(record) + "\n")
+            stream.flush()
+    return [summarize(path, sorted(results[path], key=lambda r: r["index"])) for path in files]
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--algorithm", type=int, default=Algorithm_Types.ITERDEEPPVS.value,
+                        help="Algorithm_Types value (see Engine/algorithm_manager.py)")
+    parser.add_argument("--depth", type=int, default=cc.MAX_DEPTH)
+    parser.add_argument("--time", type=float, default=cc.TIME_LIMIT, help="seconds per position, 0 for none")
+    parser.add_argument("--limit", type=int, default=None, help="only the first N positions of each file")
+    parser.add_argument("--warm", action="store_true", help="keep tables between positions")
+    parser.add_argument("--workers", type=int, default=1, help="processes to share the positions over")
+    parser.add_argument("--jsonl", default=None, help="stream per-position results here ('-' for stdout)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a search configuration on test_data suites")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    algorithm = Algorithm_Types(args.algorithm)
+    time_limit = args.time or None
+    stream = None
+    if args.jsonl == "-":
+        stream = sys.stdout
+    elif args.jsonl is not None:
+        stream = open(args.jsonl, "w")
+
+    summaries = benchmark(args.files, algorithm, args.depth, time_limit,
+                          args.limit, args.warm, args.workers, stream)
+    if stream is not None and stream is not sys.stdout:
+        stream.close()
+    print(f"{algorithm.name}, depth {args.depth}, time {time_limit}")
+    for s in summaries:
+        print(format_summary(s))
+
+if __name__ == "__main__":
+    main()
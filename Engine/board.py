@@ -1,5 +1,95 @@
+import random
 import numpy as np
 import Engine.config_constants as cc
+from Engine.windows import CELL_WINDOWS, WINDOWS, MY_GAIN, OPP_GAIN, CENTER_WEIGHT
+
+# Bitboard layout: every column owns ROWS + 1 bits, bottom cell first. The
+# spare bit on top of each column always stays empty so that shifting a mask
+# by a whole column can never carry a disc over into the next column.
+#
+#   .  .  .  .  .  .  .
+#   5 12 19 26 33 40 47
+#   4 11 18 25 32 39 46
+#   3 10 17 24 31 38 45
+#   2  9 16 23 30 37 44
+#   1  8 15 22 29 36 43
+#   0  7 14 21 28 35 42
+H1 = cc.ROWS + 1
+COLUMN_BITS = (1 << cc.ROWS) - 1
+BOTTOM_MASKS = [1 << (c * H1) for c in range(cc.COLS)]
+TOP_MASKS = [1 << (cc.ROWS - 1 + c * H1) for c in range(cc.COLS)]
+COLUMN_MASKS = [COLUMN_BITS << (c * H1) for c in range(cc.COLS)]
+BOTTOM_MASK = sum(BOTTOM_MASKS)
+BOARD_MASK = BOTTOM_MASK * COLUMN_BITS
+CENTRE_ORDER = [3, 2, 4, 1, 5, 0, 6]
+
+# Shift that steps one cell along each line direction
+# (vertical, horizontal, diagonal /, diagonal \)
+DIRECTIONS = (1, H1, H1 + 1, H1 - 1)
+
+# Zobrist keys, one random 64-bit word per (player, bit position) plus one for
+# the side to move. Seeded so keys are identical in every process.
+_zobrist_rng = random.Random(3821)
+ZOBRIST = {
+    player: [_zobrist_rng.getrandbits(64) for _ in range(cc.COLS * H1)]
+    for player in (1, -1)
+}
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+
+
+def bit_index(row, col):
+    """Bit position of grid cell (row, col); row 0 is the top row."""
+    return col * H1 + (cc.ROWS - 1 - row)
+
+
+# Windows touching each bit position (the spare top bits touch none)
+BIT_WINDOWS = [()] * (cc.COLS * H1)
+for _r in range(cc.ROWS):
+    for _c in range(cc.COLS):
+        BIT_WINDOWS[bit_index(_r, _c)] = tuple(CELL_WINDOWS[_r][_c])
+CENTER_COL = cc.COLS // 2
+
+
+def has_four(stones):
+    """Check whether a stone mask contains 4-in-a-row, using shifts only."""
+    for d in DIRECTIONS:
+        m = stones & (stones >> d)
+        if m & (m >> (2 * d)):
+            return True
+    return False
+
+
+def winning_cells(stones, mask):
+    """Empty cells that would complete 4-in-a-row for 'stones'."""
+    # vertical: only the cell directly above three stacked stones
+    r = (stones << 1) & (stones << 2) & (stones << 3)
+    for d in DIRECTIONS[1:]:
+        # three stones to one side, or two on one side and one on the other
+        p = (stones << d) & (stones << (2 * d))
+        r |= p & (stones << (3 * d))
+        r |= p & (stones >> d)
+        p = (stones >> d) & (stones >> (2 * d))
+        r |= p & (stones << d)
+        r |= p & (stones >> (3 * d))
+    return r & (BOARD_MASK ^ mask)
+
+
+def mirror_bits(bits):
+    """
+    Reflect a bitboard left to right (column c <-> COLS - 1 - c). All H1
+    bits of a column move, spare bit included, so position keys mirror too.
+    """
+    column = (1 << H1) - 1
+    r = 0
+    for c in range(cc.COLS):
+        r |= ((bits >> (c * H1)) & column) << ((cc.COLS - 1 - c) * H1)
+    return r
+
+
+def bit_columns(bits):
+    """Columns of the set bits of a move mask, in centre order."""
+    return [c for c in CENTRE_ORDER if bits & COLUMN_MASKS[c]]
+
 
 class Board:
     """
@@ -8,67 +98,193 @@ class Board:
       1  = current player (maximizer)
      -1  = opponent
       0  = empty
+
+    Internally the position is two bitboards: `position` holds the discs of
+    player 1 and `mask` holds every occupied cell, so player -1 owns
+    `position ^ mask`.
+
+    `key` is a 64-bit Zobrist hash of the discs and the side to move, kept
+    up to date by play/undo. A board built from a grid is taken to have
+    player 1 to move, and play/undo are assumed to alternate players.
+
+    `windows` holds the encoded (mine, theirs) disc counts of every
+    four-cell window and `eval_score` the evaluation of the position for
+    player 1; play/undo only touch the windows through the played cell.
     """
 
     last_move: tuple[int, int] = None # (row, col)
     def __init__(self, grid=None):
-        self.grid = np.zeros((cc.ROWS, cc.COLS), dtype=np.int8) if grid is None else grid.copy()
-        # Precompute current heights in each column (how many pieces already placed)
-        self.heights = np.array([np.count_nonzero(self.grid[:, c]) for c in range(cc.COLS)], dtype=np.int8)
+        self.position = 0
+        self.mask = 0
+        self.moves = 0
+        self.key = 0
+        self.windows = [0] * len(WINDOWS)
+        self.eval_score = 0
+        if grid is not None:
+            for c in range(cc.COLS):
+                for r in range(cc.ROWS - 1, -1, -1):
+                    if grid[r, c] == 0:
+                        continue
+                    player = int(grid[r, c])
+                    i = bit_index(r, c)
+                    self.mask |= 1 << i
+                    if player == 1:
+                        self.position |= 1 << i
+                    self.key ^= ZOBRIST[player][i]
+                    self._add_to_windows(i, c, player)
+                    self.moves += 1
+
+    def _add_to_windows(self, i, col, player):
+        """Count a disc on bit 'i' in its windows and update eval_score."""
+        windows = self.windows
+        score = self.eval_score
+        if player == 1:
+            for w in BIT_WINDOWS[i]:
+                code = windows[w]
+                windows[w] = code + 5
+                score += MY_GAIN[code]
+        else:
+            for w in BIT_WINDOWS[i]:
+                code = windows[w]
+                windows[w] = code + 1
+                score += OPP_GAIN[code]
+        if col == CENTER_COL:
+            score += CENTER_WEIGHT * player
+        self.eval_score = score
+
+    def _remove_from_windows(self, i, col, player):
+        """Reverse _add_to_windows for the disc on bit 'i'."""
+        windows = self.windows
+        score = self.eval_score
+        if player == 1:
+            for w in BIT_WINDOWS[i]:
+                code = windows[w] - 5
+                windows[w] = code
+                score -= MY_GAIN[code]
+        else:
+            for w in BIT_WINDOWS[i]:
+                code = windows[w] - 1
+                windows[w] = code
+                score -= OPP_GAIN[code]
+        if col == CENTER_COL:
+            score -= CENTER_WEIGHT * player
+        self.eval_score = score
+
+    @property
+    def heights(self):
+        """Number of discs in each column."""
+        return [((self.mask >> (c * H1)) & COLUMN_BITS).bit_length() for c in range(cc.COLS)]
+
+    def height(self, col):
+        """Number of discs in column 'col'."""
+        return ((self.mask >> (col * H1)) & COLUMN_BITS).bit_length()
+
+    @property
+    def grid(self):
+        """6x7 int8 view of the position (built on demand, not for hot loops)."""
+        grid = np.zeros((cc.ROWS, cc.COLS), dtype=np.int8)
+        for c in range(cc.COLS):
+            for r in range(cc.ROWS):
+                bit = 1 << bit_index(r, c)
+                if self.mask & bit:
+                    grid[r, c] = 1 if self.position & bit else -1
+        return grid
+
+    def stones(self, player):
+        """Bitboard of the discs of 'player' (1 or -1)."""
+        return self.position if player == 1 else self.position ^ self.mask
+
+    def possible(self):
+        """Bitboard of the cells a disc can be dropped into right now."""
+        return (self.mask + BOTTOM_MASK) & BOARD_MASK
+
+    def winning_moves(self, player):
+        """Bitboard of the playable cells that win immediately for 'player'."""
+        return winning_cells(self.stones(player), self.mask) & self.possible()
+
+    def non_losing_moves(self, player):
+        """
+        Bitboard of the playable cells for 'player' that do not hand the
+        opponent an immediate win, assuming 'player' cannot win at once.
+        Zero means every move loses: two or more opponent threats must be
+        blocked, or every move drops a disc under an opponent winning cell.
+        """
+        possible = self.possible()
+        opponent_win = winning_cells(self.stones(-player), self.mask)
+        forced = possible & opponent_win
+        if forced:
+            if forced & (forced - 1):
+                return 0
+            possible = forced
+        return possible & ~(opponent_win >> 1)
+
+    def threats_after(self, col, player):
+        """
+        Number of winning cells 'player' would own after dropping a disc
+        in 'col' (open threes and the like), counted with bitboard ops.
+        """
+        move = (self.mask + BOTTOM_MASKS[col]) & COLUMN_MASKS[col]
+        return winning_cells(self.stones(player) | move, self.mask | move).bit_count()
+
+    def can_play(self, col):
+        """Check whether column 'col' still has an empty cell."""
+        return not self.mask & TOP_MASKS[col]
 
     def legal_moves(self):
         """Return list of legal columns in natural order (no move ordering)."""
-        return [c for c in range(cc.COLS) if self.heights[c] < cc.ROWS]
+        return [c for c in range(cc.COLS) if not self.mask & TOP_MASKS[c]]
 
     def centre_legal_moves(self):
         """Return list of legal columns going out from centre. (centre ordering)."""
         # It may be more beneficial to have a right-first centre ordering in some cases
-        centre_order = [3, 2, 4, 1, 5, 0, 6] 
-        return [c for c in centre_order if self.heights[c] < cc.ROWS]
+        return [c for c in CENTRE_ORDER if not self.mask & TOP_MASKS[c]]
 
     def play(self, col, player):
         """Drop a disc for 'player' (1 or -1). Return the row index used."""
-        r = cc.ROWS - 1 - self.heights[col]
-        self.grid[r, col] = player
-        self.heights[col] += 1
+        # Adding the column's bottom bit carries up to the first empty cell
+        move = (self.mask + BOTTOM_MASKS[col]) & COLUMN_MASKS[col]
+        self.mask |= move
+        if player == 1:
+            self.position |= move
+        self.moves += 1
+        i = move.bit_length() - 1
+        self.key ^= ZOBRIST[player][i] ^ ZOBRIST_SIDE
+        self._add_to_windows(i, col, player)
+        r = cc.ROWS - 1 - i + col * H1
         self.last_move = (r, col)
         return r
 
     def undo(self, col):
         """Undo last move in the given column."""
-        if self.heights[col] == 0:
+        column = self.mask & COLUMN_MASKS[col]
+        if column == 0:
             return
-        r = cc.ROWS - self.heights[col]
-        self.grid[r, col] = 0
-        self.heights[col] -= 1
+        i = column.bit_length() - 1
+        top = 1 << i
+        player = 1 if self.position & top else -1
+        self.key ^= ZOBRIST[player][i] ^ ZOBRIST_SIDE
+        self._remove_from_windows(i, col, player)
+        self.mask ^= top
+        self.position &= ~top
+        self.moves -= 1
         self.last_move = None
 
     def is_full(self):
         """Check whether board is full (draw if no winner)."""
-        return all(self.heights[c] == cc.ROWS for c in range(cc.COLS))
+        return self.mask == BOARD_MASK
 
     def is_win_at(self, row, col):
-        """Check 4-in-a-row for the stone at (row, col)."""
-        player = self.grid[row, col]
-        if player == 0:
+        """
+        Check 4-in-a-row for the owner of the stone at (row, col).
+        The whole bitboard of that player is tested, which is equivalent as
+        long as the position held no four before that stone was dropped.
+        """
+        bit = 1 << bit_index(row, col)
+        if not self.mask & bit:
             return False
-        dirs = [(0,1),(1,0),(1,1),(1,-1)]
-        for dr, dc in dirs:
-            count = 1
-            # forward
-            rr, ccol = row+dr, col+dc
-            while 0 <= rr < cc.ROWS and 0 <= ccol < cc.COLS and self.grid[rr, ccol] == player:
-                count += 1
-                rr += dr; ccol += dc
-            # backward
-            rr, ccol = row-dr, col-dc
-            while 0 <= rr < cc.ROWS and 0 <= ccol < cc.COLS and self.grid[rr, ccol] == player:
-                count += 1
-                rr -= dr; ccol -= dc
-            if count >= cc.CONNECT_N:
-                return True
-        return False
-    
+        stones = self.position if self.position & bit else self.position ^ self.mask
+        return has_four(stones)
+
     # check for draw or game over
     def is_terminal(self):
         if self.last_move is None:
@@ -76,6 +292,22 @@ class Board:
         r, c = self.last_move
         return self.is_win_at(r, c) or self.is_full()
 
+# Build a Board from a move string such as "4453"
+def board_from_moves(moves: str):
+    """
+    'moves' lists the columns played from the empty board, 1-indexed (the
+    test_data format). Players alternate so that player 1 is to move next.
+    """
+    b = Board()
+    player = 1 if len(moves) % 2 == 0 else -1
+    for ch in moves:
+        b.play(int(ch) - 1, player)
+        player = -player
+    if len(moves) % 2:
+        # Started with player -1, so the side-to-move term is off by one ply
+        b.key ^= ZOBRIST_SIDE
+    return b
+
 # Convert PettingZoo obs -> Board
 def board_from_obs(obs):
     """
@@ -9,8 +9,12 @@ CONNECT_N = 4
 WIN_SCORE = 1000000     # score for a forced win
 LOSS_SCORE = -1000000
 DRAW_SCORE = 0
+ASPIRATION_WINDOW = 50  # initial half-width around the previous iteration's score
+ENDGAME_EMPTY_CELLS = 16  # solve exactly instead of searching once this few cells are empty
+ENDGAME_TIME_SHARE = 0.5  # part of the move time the endgame solve may use before falling back to search
 
 # Engine defaults
 MAX_DEPTH = 12
 TIME_LIMIT = 0.5
-TRANSPOSITION_TABLE_SIZE = 1_000_000
+TRANSPOSITION_TABLE_SIZE = 16 * 1024 * 1024  # bytes, 32 bytes per two-entry bucket
+ENDGAME_TABLE_SIZE = 2 * 1024 * 1024  # bytes, the endgame solver's own table
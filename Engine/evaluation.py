@@ -1,9 +1,16 @@
 # Engine/evaluation.py
 
 from Engine.board import Board
+from Engine.windows import WINDOW_CELLS, CENTER_CELLS, WINDOW_STATE_SCORES, CENTER_WEIGHT
 import numpy as np
 import Engine.config_constants as cc
 
+# NumPy copies of the shared window tables for the batched evaluator
+WINDOW_INDEX = np.array(WINDOW_CELLS, dtype=np.intp)    # (69, 4)
+CENTER_INDEX = np.array(CENTER_CELLS, dtype=np.intp)
+WINDOW_POWERS = 3 ** np.arange(4)
+STATE_SCORES = np.array(WINDOW_STATE_SCORES, dtype=np.int64)
+
 def evaluate(b: Board) -> int:
 
 
@@ -18,46 +25,31 @@ def evaluate(b: Board) -> int:
      * -35                  (#my_disc, #opp_disc, #empty) = (0,3,1)
      * -WIN_SCORE           (#my_disc, #opp_disc, #empty) = (0,4,0)
      * 0                    otherwise
+
+    Board.play/undo keep the per-window counts and this score up to date
+    (see Engine/windows.py), so a leaf evaluation is a single read.
+    """
+    return b.eval_score
+
+def evaluate_full(b: Board) -> int:
     """
-    k = 2 # How important the center is
-
-    score = 0
-
-    center = cc.COLS // 2
-    score += k * (np.count_nonzero(b.grid[:, center] == 1) - np.count_nonzero(b.grid[:, center] == -1))
-    
-    def window_score(window):
-        myc = np.count_nonzero(window == 1)
-        opc = np.count_nonzero(window == -1)
-        empty = 4 - myc - opc
-
-        if myc == 4:
-            return cc.WIN_SCORE
-        if opc == 4:
-            return cc.LOSS_SCORE
-
-        s = 0
-        if myc == 3 and empty == 1: s += 30
-        if myc == 2 and empty == 2: s += 6
-        if opc == 3 and empty == 1: s -= 35
-        if opc == 2 and empty == 2: s -= 6
-        return s
-
-    # Horizontal
-    for r in range(cc.ROWS):
-        for c in range(cc.COLS-3):
-            score += window_score(b.grid[r, c:c+4])
-    # Vertical
-    for c in range(cc.COLS):
-        for r in range(cc.ROWS-3):
-            score += window_score(b.grid[r:r+4, c])
-    # Diagonal (\)
-    for r in range(cc.ROWS-3):
-        for c in range(cc.COLS-3):
-            score += window_score(np.array([b.grid[r+i, c+i] for i in range(4)], dtype=np.int8))
-    # Diagonal (/)
-    for r in range(3, cc.ROWS):
-        for c in range(cc.COLS-3):
-            score += window_score(np.array([b.grid[r-i, c+i] for i in range(4)], dtype=np.int8))
+    Rescan all 69 windows of b.grid. Gives the same score as evaluate;
+    kept as the reference the incremental score is checked against.
+    """
+    cells = b.grid.ravel().tolist()
+    score = CENTER_WEIGHT * sum(cells[i] for i in CENTER_CELLS)
+    for w0, w1, w2, w3 in WINDOW_CELLS:
+        score += WINDOW_STATE_SCORES[cells[w0] % 3 + 3 * (cells[w1] % 3) + 9 * (cells[w2] % 3) + 27 * (cells[w3] % 3)]
+    return score
 
+def evaluate_batch(grids) -> np.ndarray:
+    """
+    Score N positions at once: 'grids' is an (N, 6, 7) array of 1 / -1 / 0.
+    Returns an int64 array of N scores, each equal to evaluate() of that grid.
+    """
+    flat = np.asarray(grids, dtype=np.int8).reshape(-1, cc.ROWS * cc.COLS)
+    digits = (flat[:, WINDOW_INDEX] % 3).astype(np.intp)   # (N, 69, 4)
+    codes = digits @ WINDOW_POWERS                          # (N, 69)
+    score = STATE_SCORES[codes].sum(axis=1)
+    score += CENTER_WEIGHT * flat[:, CENTER_INDEX].sum(axis=1, dtype=np.int64)
     return score
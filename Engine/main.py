@@ -23,7 +23,7 @@ def select_options() -> tuple[str, int, bool]:
     is_debug = None
 
     valid_bool_input = ["Y", "N", "YES", "NO"]
-    vaild_algorithm_input = ["0", "1", "2", "3", "4", "5", "6"]
+    vaild_algorithm_input = ["0", "1", "2", "3", "4", "5", "6", "7", "8"]
 
     # Choose whether the player goes first or second
     first_move_qry = input("Player first move? [y/n]: ").capitalize()
@@ -45,6 +45,8 @@ def select_options() -> tuple[str, int, bool]:
         4: Minimax w AB and ID
         5: Minimax w AB, ID and TT
         6: Minimax w AB, ID, TT, Move ordering
+        7: Negamax w PVS, ID, TT, Move ordering
+        8: Exact solver
         Select an Algorithm: """
     )
     while algorithm_qry not in vaild_algorithm_input:
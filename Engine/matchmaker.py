@@ -32,10 +32,12 @@ def select_options() -> tuple[int, int, bool]:
         4: Minimax w AB and ID
         5: Minimax w AB, ID and TT
         6: Minimax w AB, ID, TT, Move ordering
+        7: Negamax w PVS, ID, TT, Move ordering
+        8: Exact solver
         Select an Algorithm: """
     
     valid_bool_input = ["Y", "N", "YES", "NO"]
-    valid_algorithm_input = ["0", "1", "2", "3", "4", "5", "6"]
+    valid_algorithm_input = ["0", "1", "2", "3", "4", "5", "6", "7", "8"]
 
     # Choose algorithm for agent_0
     algorithm_qry = input(ALGORITHM_QUERY_STRING)
@@ -0,0 +1,91 @@
+# Engine/opening_book.py
+# Opening book: the best move and score of every position up to a given ply,
+# computed offline and looked up before searching.
+#
+# usage: python -m Engine.opening_book [--plies N] [--depth D | --solve]
+#                                      [--workers W] out.book
+#
+# The book is a position database (Engine/position_db.py) with one record
+# per mirror pair of positions. Scores are on the scale of the search that
+# built it (evaluation units for --depth, exact test_data scores for --solve).
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import Engine.config_constants as cc
+from Engine.board import (board_from_moves, has_four, mirror_bits,
+                          BOTTOM_MASKS, COLUMN_MASKS, TOP_MASKS)
+from Engine.evaluation import evaluate
+from Engine.search_context import SearchContext
+from Engine.search_engine import SearchEngine
+from Engine.position_db import position_key, canonical_key, write_db
+
+def book_positions(plies):
+    """Move strings (1-indexed columns) of every position up to 'plies', one per mirror pair."""
+    seen = {}
+
+    def visit(cur, mask, moves):
+        key = position_key(cur, mask)
+        key = min(key, mirror_bits(key))
+        if key in seen:
+            return
+        seen[key] = moves
+        if len(moves) == plies:
+            return
+        for col in range(cc.COLS):
+            if mask & TOP_MASKS[col]:
+                continue
+            move = (mask + BOTTOM_MASKS[col]) & COLUMN_MASKS[col]
+            if has_four(cur | move):
+                continue  # game over, nothing to look up
+            visit(cur ^ mask, mask | move, moves + str(col + 1))
+
+    visit(0, 0, "")
+    return list(seen.values())
+
+# Per-process state of the builder pool
+_engine = None
+_ctx = None
+
+def _init_worker(depth, solve):
+    global _engine, _ctx
+    _engine = SearchEngine()
+    _ctx = SearchContext(eval_func=evaluate, max_depth=depth, time_limit=None,
+                         use_pvs=True, use_solver=solve)
+
+def _book_entry(moves):
+    """(key, move, score) for one position, oriented to its canonical key."""
+    # Search every position from empty tables, so its entry does not depend
+    # on which positions this worker happened to search before it
+    _ctx.clear_tables()
+    board = board_from_moves(moves)
+    move, score = _engine.make_move(board, _ctx)
+    key, mirrored = canonical_key(board.position, board.mask)
+    return key, (cc.COLS - 1 - move if mirrored else move), score
+
+def build_book(path, plies, depth, solve=False, workers=None):
+    """Search every book position across 'workers' processes and write the file."""
+    positions = book_positions(plies)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(depth, solve)) as pool:
+        entries = list(pool.map(_book_entry, positions, chunksize=64))
+    write_db(path, entries)
+    return len(entries)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the opening book")
+    parser.add_argument("out")
+    parser.add_argument("--plies", type=int, default=8, help="book every position up to this many discs")
+    parser.add_argument("--depth", type=int, default=cc.MAX_DEPTH, help="search depth per position")
+    parser.add_argument("--solve", action="store_true", help="exact solve instead of a depth-limited search")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    start = time.time()
+    count = build_book(args.out, args.plies, args.depth, args.solve, args.workers)
+    print(f"{args.out}: {count} positions up to ply {args.plies} in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# Engine/parallel_search.py
+# Parallel search modes.
+#
+# Lazy SMP: helper processes run the same iterative deepening search as the
+# main process, all storing into one shared transposition table. The helpers
+# use slightly different move orders and start depths, so their trees drift
+# apart and the entries they leave behind speed up each other's searches.
+#
+# Root splitting: each root move is searched by a process from a pool, with
+# no shared state beyond the deadline. Meant for the types without a table.
+
+import multiprocessing as mp
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from dataclasses import fields
+
+from Engine.board import Board
+from Engine.search_context import SearchContext
+from Engine.search_engine import SearchEngine
+from Engine.search_stats import SearchStats
+from Engine.transposition_table import TranspositionTable, SharedTranspositionTable
+
+# How long to wait for helpers after the time limit before moving on
+RESULT_GRACE = 0.05
+# How long helper processes may take to start up and report ready
+STARTUP_TIMEOUT = 60
+
+def search_flags(ctx: SearchContext) -> dict:
+    """The picklable settings a helper needs to rebuild ctx."""
+    keep = ("max_depth", "time_limit", "eval_func")
+    return {f.name: getattr(ctx, f.name) for f in fields(ctx)
+            if f.name.startswith("use_") or f.name in keep}
+
+def _helper_main(worker_id, tt_name, flags, tasks, results):
+    """Helper process loop: search each position posted until told to stop."""
+    tt = SharedTranspositionTable.attach(tt_name)
+    ctx = SearchContext(tt=tt, **flags)
+    # Vary the search per helper: alternate the first depth, and flip the
+    # ordering mode for every other pair
+    first_depth = 1 + worker_id % 2
+    if (worker_id // 2) % 2:
+        ctx.use_threat_ordering = not ctx.use_threat_ordering
+    engine = SearchEngine()
+    results.put((0, worker_id, 0, None, 0, 0))  # job 0: ready
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        job, grid, start, generation = task
+        ctx.start = start
+        ctx.nodes = 0
+        ctx.completed_depth = 0
+        ctx.new_move_ordering()
+        tt.generation = generation
+        ctx.stats = SearchStats()
+        ctx.stats.start(ctx)
+        move, score = engine.iterative_deepening(Board(grid), ctx, first_depth)
+        results.put((job, worker_id, ctx.completed_depth, move, score, ctx.nodes))
+
+    tt.close()
+
+class LazySMP:
+    """
+    Runs SearchEngine moves with ctx.smp_workers helper processes. The
+    helpers stay alive between moves; close() stops them. The constructor
+    returns once every helper has attached to the table and is ready.
+    """
+    def __init__(self, ctx: SearchContext):
+        if not isinstance(ctx.tt, SharedTranspositionTable):
+            raise ValueError("Lazy SMP needs a SharedTranspositionTable in ctx.tt")
+        self.ctx = ctx
+        self.engine = SearchEngine()
+        self.job = 0
+
+        mp_ctx = mp.get_context("spawn")
+        self.results = mp_ctx.Queue()
+        self.tasks = []
+        self.helpers = []
+        flags = search_flags(ctx)
+        for worker_id in range(ctx.smp_workers):
+            tasks = mp_ctx.Queue()
+            helper = mp_ctx.Process(target=_helper_main, daemon=True,
+                                    args=(worker_id, ctx.tt.name, flags, tasks, self.results))
+            helper.start()
+            self.tasks.append(tasks)
+            self.helpers.append(helper)
+
+        deadline = time.time() + STARTUP_TIMEOUT
+        for _ in self.helpers:
+            try:
+                self.results.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                self.close()
+                raise RuntimeError("Lazy SMP helpers did not start")
+
+    def make_move(self, board: Board):
+        ctx = self.ctx
+        self.engine.start_move(ctx)
+
+        result = None
+        if self.engine.in_endgame(board, ctx):
+            result = self.engine.solve_endgame(board, ctx)
+        if result is None:
+            result = self.engine.decided_root_move(board, ctx)
+        if result is not None:
+            ctx.stats.finish(ctx)
+            return result
+
+        self.job += 1
+        task = (self.job, board.grid, ctx.start, ctx.tt.generation)
+        for tasks in self.tasks:
+            tasks.put(task)
+
+        move, score = self.engine.iterative_deepening(board, ctx)
+        best = (ctx.completed_depth, move, score)
+
+        # Take the deepest completed iteration; ties go to the main process
+        waiting = len(self.helpers)
+        deadline = (ctx.start + ctx.time_limit if ctx.time_limit is not None else None)
+        while waiting:
+            timeout = None if deadline is None else max(0.0, deadline + RESULT_GRACE - time.time())
+            try:
+                job, _, depth, move, score, nodes = self.results.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if job != self.job:
+                continue  # late answer to an earlier move
+            waiting -= 1
+            ctx.nodes += nodes
+            if move is not None and depth > best[0]:
+                best = (depth, move, score)
+
+        ctx.completed_depth = best[0]
+        ctx.stats.finish(ctx)
+        return best[1], best[2]
+
+    def close(self):
+        for tasks in self.tasks:
+            tasks.put(None)
+        for helper in self.helpers:
+            helper.join(timeout=1)
+        self.tasks = []
+        self.helpers = []
+
+# Per-process search state of a RootSplitter pool worker
+_root_engine = None
+_root_ctx = None
+
+def _root_init(flags, ready):
+    global _root_engine, _root_ctx
+    _root_engine = SearchEngine()
+    # These searches never touch a table, so keep the unused one tiny
+    tt = TranspositionTable() if flags["use_tt"] else TranspositionTable(0)
+    _root_ctx = SearchContext(tt=tt, **flags)
+    ready.put(True)
+
+def _root_ready():
+    """No-op task; submitting one per worker makes the pool start them all."""
+
+def _root_search(grid, move, depth, alpha, beta, start):
+    """Search one root move; returns (score, nodes, timed_out)."""
+    ctx = _root_ctx
+    ctx.start = start
+    ctx.nodes = 0
+    ctx.new_move_ordering()
+    board = Board(grid)
+    board.play(move, 1)
+    score = _root_engine.search(board, depth - 1, alpha, beta, False, ctx)
+    return score, ctx.nodes, ctx.time_exceeded()
+
+class RootSplitter:
+    """
+    Process pool for SearchEngine.search_root_split. The pool lives as long
+    as the splitter, and the constructor waits until every worker is up,
+    so worker startup is paid once and never inside a move's time limit.
+    """
+    def __init__(self, ctx: SearchContext):
+        mp_ctx = mp.get_context("spawn")
+        ready = mp_ctx.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=ctx.root_workers,
+                                        mp_context=mp_ctx,
+                                        initializer=_root_init,
+                                        initargs=(search_flags(ctx), ready))
+        # The pool only spawns a worker per submitted task
+        for f in [self.pool.submit(_root_ready) for _ in range(ctx.root_workers)]:
+            f.result(timeout=STARTUP_TIMEOUT)
+        deadline = time.time() + STARTUP_TIMEOUT
+        for _ in range(ctx.root_workers):
+            ready.get(timeout=max(0.0, deadline - time.time()))
+
+    def search_moves(self, board: Board, moves, depth, alpha, beta, ctx: SearchContext):
+        """
+        (score, nodes, timed_out) for each move, in the order given. A move
+        still unanswered RESULT_GRACE after the time limit is reported as
+        timed out with a score of -inf.
+        """
+        if not ctx.use_ab:
+            alpha, beta = -10**9, 10**9
+        grid = board.grid
+        futures = [self.pool.submit(_root_search, grid, m, depth, alpha, beta, ctx.start)
+                   for m in moves]
+        deadline = (ctx.start + ctx.time_limit + RESULT_GRACE if ctx.time_limit is not None else None)
+        results = []
+        for f in futures:
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.time())
+                results.append(f.result(timeout=timeout))
+            except TimeoutError:
+                f.cancel()
+                results.append((float('-inf'), 0, True))
+        return results
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
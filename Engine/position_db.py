@@ -0,0 +1,109 @@
+# Engine/position_db.py
+# Read-only position database: the best move and score of known positions,
+# memory-mapped so opening it reads nothing up front and every process
+# probing the same file shares its pages.
+#
+# File layout (little-endian):
+#   header   DB_MAGIC, record count, index stride, index length (4 x u64)
+#   index    the key of every INDEX_STRIDE-th record (u64)
+#   records  packed (key u64, move u8, score i32), sorted by key
+#
+# Keys are side-to-move discs + mask, which is unique for a position, and a
+# position and its mirror image share one record under the smaller of the
+# two keys. Scores are for the side to move.
+#
+# A lookup binary-searches the small index for the block of INDEX_STRIDE
+# records that could hold the key, then binary-searches only that block,
+# so a probe touches one or two pages of the record area.
+
+import numpy as np
+
+import Engine.config_constants as cc
+from Engine.board import bit_index, mirror_bits
+
+DB_MAGIC = 0x42443443  # "C4DB"
+HEADER = np.dtype([("magic", "<u8"), ("count", "<u8"), ("stride", "<u8"), ("index", "<u8")])
+RECORD = np.dtype([("key", "<u8"), ("move", "u1"), ("score", "<i4")])  # packed, 13 bytes
+INDEX_STRIDE = 256  # records per index entry (about 3 KiB of records)
+
+def position_key(cur, mask):
+    """Key of a position from the side to move's discs and the occupied mask."""
+    return cur + mask
+
+def canonical_key(cur, mask):
+    """(key shared by the position and its mirror, whether it is the mirror's)."""
+    key = position_key(cur, mask)
+    mirrored = position_key(mirror_bits(cur), mirror_bits(mask))
+    return (mirrored, True) if mirrored < key else (key, False)
+
+def grid_bits(grid):
+    """(player 1 discs, occupied mask) of a 6x7 grid of 1 / -1 / 0."""
+    cur = mask = 0
+    for r in range(cc.ROWS):
+        for c in range(cc.COLS):
+            if grid[r][c]:
+                bit = 1 << bit_index(r, c)
+                mask |= bit
+                if grid[r][c] == 1:
+                    cur |= bit
+    return cur, mask
+
+def write_db(path, entries, stride=INDEX_STRIDE):
+    """Write [(key, move, score)] as a database file; keys must be unique."""
+    records = np.array(sorted(entries), dtype=RECORD)
+    index = records["key"][::stride].astype("<u8")
+    header = np.array([(DB_MAGIC, len(records), stride, len(index))], dtype=HEADER)
+    with open(path, "wb") as f:
+        header.tofile(f)
+        index.tofile(f)
+        records.tofile(f)
+
+class PositionDB:
+    """
+    A database file opened with np.memmap. probe() takes an Engine Board,
+    probe_grid() any grid with player 1 to move (e.g. the legacy
+    Algorithms board); both return (move, score) or None.
+    """
+    def __init__(self, path):
+        header = np.memmap(path, dtype=HEADER, mode="r", shape=(1,))[0]
+        if header["magic"] != DB_MAGIC:
+            raise ValueError(f"{path!r} is not a position database")
+        count, self.stride, length = int(header["count"]), int(header["stride"]), int(header["index"])
+        self.index = np.memmap(path, dtype="<u8", mode="r", offset=HEADER.itemsize, shape=(length,))
+        self.records = np.memmap(path, dtype=RECORD, mode="r",
+                                 offset=HEADER.itemsize + 8 * length, shape=(count,))
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def lookup(self, key):
+        """(move, score) stored under 'key', or None."""
+        block = int(np.searchsorted(self.index, key, side="right")) - 1
+        if block < 0:
+            self.misses += 1
+            return None
+        lo = block * self.stride
+        keys = self.records["key"][lo:lo + self.stride]
+        i = int(np.searchsorted(keys, key))
+        if i == len(keys) or keys[i] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        record = self.records[lo + i]
+        return int(record["move"]), int(record["score"])
+
+    def probe_bits(self, cur, mask):
+        """(move, score) for the position of side-to-move discs 'cur', or None."""
+        key, mirrored = canonical_key(cur, mask)
+        hit = self.lookup(key)
+        if hit is None or not mirrored:
+            return hit
+        return cc.COLS - 1 - hit[0], hit[1]
+
+    def probe(self, board):
+        return self.probe_bits(board.position, board.mask)
+
+    def probe_grid(self, grid):
+        return self.probe_bits(*grid_bits(grid))
@@ -1,6 +1,7 @@
 import time
 from dataclasses import dataclass
 from Engine.transposition_table import TranspositionTable
+from Engine.search_stats import SearchStats
 import Engine.config_constants as cc
 
 @dataclass
@@ -13,13 +14,75 @@ class SearchContext:
     use_tt: bool = True
     use_id: bool = True
     use_move_ordering: bool = True
+    use_non_losing: bool = True  # skip moves that hand the opponent an immediate win
+    use_pvs: bool = False  # negamax + principal variation search instead of minimax
+    use_aspiration: bool = True  # iterative deepening searches a window around the last score
+    use_killer_history: bool = True  # order non-TT moves by killer slots and the history table
+    use_threat_ordering: bool = False  # order moves by the winning cells they create (overrides killers/history)
+    use_solver: bool = False  # exact game-theoretic solve, no depth limit or evaluation
+    use_null_window: bool = True  # solver narrows the score with null-window probes
+    use_endgame_solver: bool = True  # solve exactly once at most endgame_empty cells are empty
+    endgame_empty: int = cc.ENDGAME_EMPTY_CELLS
 
     tt: TranspositionTable = None
+    solver_tt: TranspositionTable = None  # table solve_search uses (None = no table)
+    endgame_tt: TranspositionTable = None  # endgame solver's own table, made on first use
     start: float = None
+    nodes: int = 0
+    leaf_evals: int = 0
+    tt_cutoffs: int = 0
+    probes: int = 0
+    stats: SearchStats = None  # per-iteration statistics of the last move
+    completed_depth: int = 0  # deepest finished iterative deepening iteration
+
+    smp_workers: int = 0  # helper processes for Lazy SMP (needs a SharedTranspositionTable)
+    root_workers: int = 0  # processes that search the root moves in parallel (minimax/AB, no PVS)
+    root_splitter: object = None  # set by SearchAlgo when root_workers > 0
+    book: object = None  # PositionDB consulted before searching (opening book)
+
+    # Move ordering state: two killer moves per disc count (i.e. per ply),
+    # and history scores indexed [side is player 1][column][height]
+    killers: list = None
+    history: list = None
+    cutoffs: int = 0
+    first_move_cutoffs: int = 0
 
     def __post_init__(self):
-        self.tt = TranspositionTable()
+        # A table handed in by the caller is kept, so it can outlive this context
+        if self.tt is None:
+            self.tt = TranspositionTable()
         self.start = None
+        self.killers = [[None, None] for _ in range(cc.ROWS * cc.COLS + 1)]
+        self.history = [[[0] * cc.ROWS for _ in range(cc.COLS)] for _ in range(2)]
+
+    def new_move_ordering(self):
+        """Reset killers and cutoff counts for a new move; halve the history."""
+        for killers in self.killers:
+            killers[0] = killers[1] = None
+        for side in self.history:
+            for column in side:
+                for h in range(cc.ROWS):
+                    column[h] //= 2
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def clear_tables(self):
+        """Forget everything learnt in earlier searches (tables and history)."""
+        self.tt.clear()
+        if self.endgame_tt is not None:
+            self.endgame_tt.clear()
+        for side in self.history:
+            for column in side:
+                column[:] = [0] * cc.ROWS
+
+    def get_ordering_stats(self) -> dict:
+        """Beta cutoffs so far and how often the first move tried caused them"""
+        rate = (self.first_move_cutoffs / self.cutoffs * 100) if self.cutoffs > 0 else 0
+        return {
+            "cutoffs": self.cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": f"{rate:.1f}%"
+        }
 
     def start_timer(self):
         self.start = time.time()
@@ -1,31 +1,172 @@
 from Engine.search_context import SearchContext
-from Engine.board import Board
-from Engine.transposition_table import NodeType
+from Engine.search_stats import SearchStats
+from Engine.board import (Board, bit_columns, winning_cells, COLUMN_MASKS,
+                          BOTTOM_MASK, BOARD_MASK, CENTRE_ORDER)
+from Engine.transposition_table import NodeType, TranspositionTable
 import Engine.config_constants as cc
 
+CELLS = cc.ROWS * cc.COLS
+
 # Algorithms/search_engine.py
 class SearchEngine:
     def make_move(self, board: Board, ctx: SearchContext):
-        ctx.start_timer()
+        """Best (move, score) for player 1; ctx.stats describes the search."""
+        self.start_move(ctx)
+        move, score = self.choose_move(board, ctx)
+        ctx.stats.finish(ctx)
+        return move, score
+
+    def choose_move(self, board: Board, ctx: SearchContext):
+        """make_move without the per-move setup."""
+        if ctx.use_solver:
+            result = self.solve_root(board, ctx)
+            ctx.stats.end_iteration(ctx, CELLS - board.moves, not ctx.time_exceeded())
+            return result
+
+        if self.in_endgame(board, ctx):
+            solved = self.solve_endgame(board, ctx)
+            if solved is not None:
+                return solved
+
+        decided = self.decided_root_move(board, ctx)
+        if decided is not None:
+            return decided
+
         if ctx.use_id:
             return self.iterative_deepening(board, ctx)
-        else:
-            return self.search_root(board, ctx.max_depth, ctx)
+
+        result = self.search_root(board, ctx.max_depth, ctx)
+        ctx.stats.end_iteration(ctx, ctx.max_depth, not ctx.time_exceeded())
+        return result
+
+    def start_move(self, ctx: SearchContext):
+        """Start the clock and reset the per-move search state."""
+        ctx.start_timer()
+        ctx.nodes = 0
+        ctx.leaf_evals = 0
+        ctx.tt_cutoffs = 0
+        ctx.completed_depth = 0
+        ctx.new_move_ordering()
+        # Keep the table between moves; older entries just lose replacement priority
+        ctx.tt.new_search()
+        ctx.stats = SearchStats()
+        ctx.stats.start(ctx)
+
+    # ---------------------------------------------------
+    # ROOT SHORTCUT: positions decided in one ply
+    # ---------------------------------------------------
+    def decided_root_move(self, board: Board, ctx: SearchContext):
+        """
+        Return (move, score) without searching when the root is decided in
+        one ply: an immediate win, a single move that does not lose at once
+        (such as a forced block), or no such move at all. Otherwise None.
+        """
+        wins = board.winning_moves(1)
+        if wins:
+            return bit_columns(wins)[0], cc.WIN_SCORE
+
+        safe = bit_columns(board.non_losing_moves(1))
+        if not safe:
+            # Lost anyway: prefer blocking one of the threats
+            threats = bit_columns(board.winning_moves(-1))
+            return (threats or board.centre_legal_moves())[0], cc.LOSS_SCORE
+        if len(safe) == 1:
+            m = safe[0]
+            board.play(m, 1)
+            score = ctx.eval_func(board)
+            board.undo(m)
+            return m, score
+
+        return None
+
+    # ---------------------------------------------------
+    # Move generation: drop moves that lose in one ply
+    # ---------------------------------------------------
+    def candidate_moves(self, board: Board, player, ctx: SearchContext):
+        """
+        Legal moves for 'player' worth searching. With use_non_losing, a
+        winning move is searched alone, moves that hand the opponent an
+        immediate win are skipped, and when every move loses only one is
+        kept to score the loss.
+        """
+        moves = board.legal_moves()
+        if not ctx.use_non_losing or not moves:
+            return moves
+
+        wins = board.winning_moves(player)
+        if wins:
+            return bit_columns(wins)[:1]
+        safe = board.non_losing_moves(player)
+        if not safe:
+            return moves[:1]
+        return [m for m in moves if safe & COLUMN_MASKS[m]]
+
+    def node_moves(self, board: Board, player, tt_move, ctx: SearchContext):
+        """Candidate moves at an interior node, TT/PV move first."""
+        moves = self.candidate_moves(board, player, ctx)
+
+        # Threats, or killers then history, ahead of centre for all but the TT move
+        if ctx.use_move_ordering and ctx.use_threat_ordering:
+            moves = self.order_moves_threats(board, moves, player)
+        elif ctx.use_move_ordering and ctx.use_killer_history:
+            moves = self.order_moves_history(board, moves, player, ctx)
+
+        # Try TT/PV move first
+        if ctx.use_move_ordering and tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        # Fallback to center-first
+        elif ctx.use_move_ordering and not (ctx.use_killer_history or ctx.use_threat_ordering):
+            moves = self.order_moves(board, moves)
+        return moves
+
+    def record_cutoff(self, board: Board, move, index, player, depth, ctx: SearchContext):
+        """Count a beta cutoff by the index-th move and feed killers / history."""
+        ctx.cutoffs += 1
+        if index == 0:
+            ctx.first_move_cutoffs += 1
+        if not ctx.use_killer_history:
+            return
+        killers = ctx.killers[board.moves]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        ctx.history[player == 1][move][board.height(move)] += depth * depth
 
     # ---------------------------------------------------
     # ROOT SEARCH
     # ---------------------------------------------------
-    def search_root(self, board: Board, depth: int, ctx: SearchContext):
+    def search_root(self, board: Board, depth: int, ctx: SearchContext, alpha=-10**9, beta=10**9):
+        """
+        Search the root moves within (alpha, beta). A returned score at or
+        below alpha is an upper bound (fail low), at or above beta a lower
+        bound (fail high); only scores strictly inside are exact.
+        """
         best_move = None
         best_score = float('-inf')
 
-        moves = board.legal_moves()
-        if ctx.use_move_ordering:
+        moves = self.candidate_moves(board, 1, ctx)
+        if ctx.use_move_ordering and ctx.use_threat_ordering:
+            moves = self.order_moves_threats(board, moves, 1)
+        elif ctx.use_move_ordering:
             moves = self.order_moves(board, moves)
 
+        if ctx.root_splitter is not None and not ctx.use_pvs:
+            return self.search_root_split(board, moves, depth, ctx, alpha, beta)
+
         for m in moves:
+            # Raise the root alpha as moves improve, so later moves can be cut
+            a = max(alpha, best_score) if ctx.use_ab else -10**9
             board.play(m, 1)
-            score = self.search(board, depth - 1, -10**9, 10**9, False, ctx)
+            if not ctx.use_pvs:
+                score = self.search(board, depth - 1, a, beta if ctx.use_ab else 10**9, False, ctx)
+            elif best_move is None:
+                score = -self.search_pvs(board, depth - 1, -beta, -a, -1, ctx)
+            else:
+                # Null window: only re-search moves that beat the best so far
+                score = -self.search_pvs(board, depth - 1, -a - 1, -a, -1, ctx)
+                if a < score < beta:
+                    score = -self.search_pvs(board, depth - 1, -beta, -score, -1, ctx)
             board.undo(m)
 
             if score > best_score:
@@ -34,10 +175,40 @@ class SearchEngine:
 
             if ctx.time_exceeded():
                 break
+            if ctx.use_ab and best_score >= beta:
+                break
+
+        # Store PV move at root (scores from an interrupted search are not reliable)
+        if ctx.use_tt and best_move is not None and not ctx.time_exceeded():
+            if best_score <= alpha:
+                node_type = NodeType.UPPER_BOUND
+            elif best_score >= beta:
+                node_type = NodeType.LOWER_BOUND
+            else:
+                node_type = NodeType.EXACT
+            ctx.tt.store(board.key, best_score, best_move, depth, node_type)
+
+        return best_move, best_score
+
+    def search_root_split(self, board: Board, moves, depth, ctx: SearchContext, alpha, beta):
+        """
+        search_root with every root move searched in its own worker process.
+        Workers all get the caller's window (no alpha raised between root
+        moves), and the results are merged in move order like the serial loop.
+        """
+        results = ctx.root_splitter.search_moves(board, moves, depth, alpha, beta, ctx)
 
-        # Store PV move at root
-        if ctx.use_tt and best_move is not None:
-            ctx.tt.store(board, best_score, best_move, depth, NodeType.EXACT)
+        best_move = None
+        best_score = float('-inf')
+        for m, (score, nodes, timed_out) in zip(moves, results):
+            ctx.nodes += nodes
+            if score > best_score:
+                best_score = score
+                best_move = m
+            if timed_out:
+                break
+            if ctx.use_ab and best_score >= beta:
+                break
 
         return best_move, best_score
 
@@ -45,12 +216,15 @@ class SearchEngine:
     # CORE SEARCH (Minimax / AB / TT / PV)
     # ---------------------------------------------------
     def search(self, board: Board, depth, alpha, beta, maximizing, ctx: SearchContext):
+        ctx.nodes += 1
         alpha_original = alpha
+        beta_original = beta
         if ctx.time_exceeded():
             return 0
 
         # Terminal or leaf
         if depth == 0 or board.is_terminal():
+            ctx.leaf_evals += 1
             return ctx.eval_func(board)
 
         # -------------------------
@@ -58,22 +232,15 @@ class SearchEngine:
         # -------------------------
         tt_move = None
         if ctx.use_tt:
-            score, tt_move = ctx.tt.lookup(board, depth, alpha, beta)
+            score, tt_move = ctx.tt.lookup(board.key, depth, alpha, beta)
             if score is not None:
+                ctx.tt_cutoffs += 1
                 return score  # exact score usable
 
         # -------------------------
         # Move Generation & PV Ordering
         # -------------------------
-        moves = board.legal_moves()
-
-        # Try TT/PV move first
-        if ctx.use_move_ordering and tt_move is not None and tt_move in moves:
-            moves.remove(tt_move)
-            moves.insert(0, tt_move)
-        # Fallback to center-first
-        elif ctx.use_move_ordering:
-            moves = self.order_moves(board, moves)
+        moves = self.node_moves(board, 1 if maximizing else -1, tt_move, ctx)
 
         best_move = None
 
@@ -82,7 +249,7 @@ class SearchEngine:
         # -------------------------
         if maximizing:
             value = -10**9
-            for m in moves:
+            for i, m in enumerate(moves):
                 board.play(m, 1)
                 score = self.search(board, depth - 1, alpha, beta, False, ctx)
                 board.undo(m)
@@ -94,10 +261,11 @@ class SearchEngine:
                 if ctx.use_ab:
                     alpha = max(alpha, value)
                     if alpha >= beta:
+                        self.record_cutoff(board, m, i, 1, depth, ctx)
                         break
         else:
             value = 10**9
-            for m in moves:
+            for i, m in enumerate(moves):
                 board.play(m, -1)
                 score = self.search(board, depth - 1, alpha, beta, True, ctx)
                 board.undo(m)
@@ -109,38 +277,335 @@ class SearchEngine:
                 if ctx.use_ab:
                     beta = min(beta, value)
                     if beta <= alpha:
+                        self.record_cutoff(board, m, i, -1, depth, ctx)
                         break
 
         # -------------------------
         # Store PV Move in TT
         # -------------------------
-        if ctx.use_tt and best_move is not None:
+        if ctx.use_tt and best_move is not None and not ctx.time_exceeded():
             if value <= alpha_original:
                 node_type = NodeType.UPPER_BOUND
-            elif value >= beta:
+            elif value >= beta_original:
                 node_type = NodeType.LOWER_BOUND
             else:
                 node_type = NodeType.EXACT
 
-            ctx.tt.store(board, value, best_move, depth, node_type)
+            ctx.tt.store(board.key, value, best_move, depth, node_type)
 
         return value
 
+    # ---------------------------------------------------
+    # NEGAMAX + PRINCIPAL VARIATION SEARCH
+    # ---------------------------------------------------
+    def search_pvs(self, board: Board, depth, alpha, beta, player, ctx: SearchContext):
+        """
+        Negamax form of search: scores are from the view of 'player', the
+        side to move (1 or -1). The first move gets the full window, later
+        moves a null window that is re-searched only if it fails high.
+        Always prunes, whatever ctx.use_ab says.
+        """
+        ctx.nodes += 1
+        if ctx.time_exceeded():
+            return 0
+
+        # Terminal or leaf
+        if depth == 0 or board.is_terminal():
+            ctx.leaf_evals += 1
+            return player * ctx.eval_func(board)
+
+        # -------------------------
+        # Transposition Table Lookup
+        # -------------------------
+        # The table holds scores for player 1, as in search()
+        tt_move = None
+        if ctx.use_tt:
+            if player == 1:
+                score, tt_move = ctx.tt.lookup(board.key, depth, alpha, beta)
+            else:
+                score, tt_move = ctx.tt.lookup(board.key, depth, -beta, -alpha)
+            if score is not None:
+                ctx.tt_cutoffs += 1
+                return player * score
+
+        moves = self.node_moves(board, player, tt_move, ctx)
+
+        alpha_original = alpha
+        best_move = None
+        value = -10**9
+        for i, m in enumerate(moves):
+            board.play(m, player)
+            if best_move is None:
+                score = -self.search_pvs(board, depth - 1, -beta, -alpha, -player, ctx)
+            else:
+                score = -self.search_pvs(board, depth - 1, -alpha - 1, -alpha, -player, ctx)
+                if alpha < score < beta:
+                    score = -self.search_pvs(board, depth - 1, -beta, -alpha, -player, ctx)
+            board.undo(m)
+
+            if score > value:
+                value = score
+                best_move = m
+
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                self.record_cutoff(board, m, i, player, depth, ctx)
+                break
+
+        # -------------------------
+        # Store PV Move in TT
+        # -------------------------
+        if ctx.use_tt and best_move is not None and not ctx.time_exceeded():
+            if value <= alpha_original:
+                node_type = NodeType.UPPER_BOUND if player == 1 else NodeType.LOWER_BOUND
+            elif value >= beta:
+                node_type = NodeType.LOWER_BOUND if player == 1 else NodeType.UPPER_BOUND
+            else:
+                node_type = NodeType.EXACT
+
+            ctx.tt.store(board.key, player * value, best_move, depth, node_type)
+
+        return value
+
+    # ---------------------------------------------------
+    # EXACT SOLVER
+    # ---------------------------------------------------
+    # Scores follow the test_data convention, from the side to move: 0 for
+    # a draw, otherwise positive for a win and negative for a loss, with
+    # magnitude (CELLS + 1 - n) // 2 where n is the number of discs on the
+    # board when the winning disc is played. Faster wins score higher.
+    def solve(self, board: Board, ctx: SearchContext):
+        """
+        Exact score of the position for player 1, who is to move.
+        With ctx.use_null_window the score interval is narrowed by repeated
+        null-window probes (MTD style), each reusing the TT of the last;
+        otherwise one full-window search is run. ctx.probes counts searches.
+        """
+        ctx.solver_tt = self.solver_table(ctx)
+        cur, mask, moves = board.position, board.mask, board.moves
+        ctx.probes = 0
+        if winning_cells(cur, mask) & (mask + BOTTOM_MASK) & BOARD_MASK:
+            return (CELLS + 1 - moves) // 2
+
+        lower, upper = -((CELLS - moves) // 2), (CELLS + 1 - moves) // 2
+        if not ctx.use_null_window:
+            ctx.probes = 1
+            return self.solve_search(cur, mask, moves, lower, upper, ctx)
+
+        while lower < upper:
+            # Bisect, but pull the probe towards 0 while the interval is wide:
+            # proving a plain win / loss first is cheaper than an exact margin
+            med = lower + (upper - lower) // 2
+            if med <= 0 and int(lower / 2) < med:
+                med = int(lower / 2)
+            elif med >= 0 and int(upper / 2) > med:
+                med = int(upper / 2)
+            score = self.solve_search(cur, mask, moves, med, med + 1, ctx)
+            ctx.probes += 1
+            if ctx.time_exceeded():
+                break
+            if score <= med:
+                upper = score
+            else:
+                lower = score
+        return lower
+
+    def solve_root(self, board: Board, ctx: SearchContext):
+        """Pick the move with the best exact score; returns (move, score)."""
+        ctx.solver_tt = self.solver_table(ctx)
+        cur, mask, moves = board.position, board.mask, board.moves
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        wins = winning_cells(cur, mask) & possible
+        if wins:
+            return bit_columns(wins)[0], (CELLS + 1 - moves) // 2
+
+        candidates = bit_columns(board.non_losing_moves(1))
+        if not candidates:
+            # Lost at the opponent's next disc: block one of the threats anyway
+            # (solve_search must not be entered with a win on the board)
+            lost = bit_columns(board.winning_moves(-1)) or board.centre_legal_moves()
+            return (lost[0] if lost else None), -((CELLS - moves) // 2)
+        # Exact value of the root (with the null-window driver), then the
+        # first move shown by a null-window probe to reach it
+        score = self.solve(board, ctx)
+        if len(candidates) == 1 or ctx.time_exceeded():
+            return candidates[0], score
+        best_move, best_score = candidates[0], score
+        for m in candidates:
+            move = possible & COLUMN_MASKS[m]
+            # Fails low for the opponent exactly when m is worth at least 'score' to us
+            value = -self.solve_search(cur ^ mask, mask | move, moves + 1, -score, -score + 1, ctx)
+            ctx.probes += 1
+            if ctx.time_exceeded():
+                break
+            if value >= score:
+                best_move = m
+                break
+        return best_move, best_score
+
+    def solver_table(self, ctx: SearchContext):
+        """Table for solve_search: ctx.tt in solver mode, else the small endgame table."""
+        if ctx.use_solver:
+            return ctx.tt if ctx.use_tt else None
+        if ctx.endgame_tt is None:
+            ctx.endgame_tt = TranspositionTable(cc.ENDGAME_TABLE_SIZE)
+        return ctx.endgame_tt
+
+    def in_endgame(self, board: Board, ctx: SearchContext):
+        """Whether few enough cells are empty to solve instead of searching."""
+        return ctx.use_endgame_solver and CELLS - board.moves <= ctx.endgame_empty
+
+    def solve_endgame(self, board: Board, ctx: SearchContext):
+        """
+        solve_root for the endgame switch, given ENDGAME_TIME_SHARE of the
+        move time, with the exact score mapped onto the search's WIN_SCORE /
+        LOSS_SCORE scale (faster wins score higher). Returns None if the
+        solve did not finish in time, leaving the rest to the normal search.
+        """
+        limit = ctx.time_limit
+        if limit is not None:
+            ctx.time_limit = limit * cc.ENDGAME_TIME_SHARE
+        try:
+            move, score = self.solve_root(board, ctx)
+            solved = not ctx.time_exceeded()
+        finally:
+            ctx.time_limit = limit
+        ctx.stats.end_iteration(ctx, CELLS - board.moves, solved)
+        if not solved:
+            return None  # an unfinished solve only has bounds, not a score
+
+        if score > 0:
+            score += cc.WIN_SCORE
+        elif score < 0:
+            score += cc.LOSS_SCORE
+        return move, score
+
+    def solve_search(self, cur, mask, moves, alpha, beta, ctx: SearchContext):
+        """
+        Negamax over raw bitboards: 'cur' holds the discs of the side to
+        move, 'mask' all discs. Assumes the side to move cannot win at once.
+        Fail-hard within [alpha, beta], with the window clipped to the
+        scores still reachable from this many discs.
+        """
+        ctx.nodes += 1
+        if ctx.time_exceeded():
+            return 0
+
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        opponent_win = winning_cells(cur ^ mask, mask)
+        forced = possible & opponent_win
+        if forced:
+            if forced & (forced - 1):
+                return -((CELLS - moves) // 2)
+            possible = forced
+        candidates = possible & ~(opponent_win >> 1)
+        if not candidates:
+            return -((CELLS - moves) // 2)
+        if moves >= CELLS - 2:
+            return 0
+
+        # We cannot lose before the opponent's next disc, nor win before our next one
+        lower = -((CELLS - 2 - moves) // 2)
+        if alpha < lower:
+            alpha = lower
+            if alpha >= beta:
+                return alpha
+        upper = (CELLS - 1 - moves) // 2
+        if beta > upper:
+            beta = upper
+            if alpha >= beta:
+                return beta
+
+        key = cur + mask  # unique per position, from the side to move
+        tt = ctx.solver_tt
+        tt_move = None
+        if tt is not None:
+            entry = tt.probe(key)
+            if entry is not None:
+                score, tt_move, _, node_type = entry
+                if node_type == NodeType.EXACT:
+                    ctx.tt_cutoffs += 1
+                    return score
+                if node_type == NodeType.UPPER_BOUND and score < beta:
+                    beta = score
+                elif node_type == NodeType.LOWER_BOUND and score > alpha:
+                    alpha = score
+                if alpha >= beta:
+                    ctx.tt_cutoffs += 1
+                    return alpha
+
+        # Most new winning cells first; ties keep centre order (stable sort)
+        scored = []
+        for c in CENTRE_ORDER:
+            move = candidates & COLUMN_MASKS[c]
+            if move:
+                scored.append((-winning_cells(cur | move, mask | move).bit_count(), c))
+        scored.sort(key=lambda sc: sc[0])
+        order = [c for _, c in scored]
+        if tt_move is not None and tt_move in order:
+            order.remove(tt_move)
+            order.insert(0, tt_move)
+
+        alpha_original = alpha
+        best_move = None
+        opponent = cur ^ mask
+        for i, c in enumerate(order):
+            move = candidates & COLUMN_MASKS[c]
+            score = -self.solve_search(opponent, mask | move, moves + 1, -beta, -alpha, ctx)
+            if score >= beta:
+                ctx.cutoffs += 1
+                if i == 0:
+                    ctx.first_move_cutoffs += 1
+                if tt is not None and not ctx.time_exceeded():
+                    tt.store(key, score, c, CELLS - moves, NodeType.LOWER_BOUND)
+                return score
+            if score > alpha:
+                alpha = score
+                best_move = c
+
+        if tt is not None and not ctx.time_exceeded():
+            node_type = NodeType.EXACT if alpha > alpha_original else NodeType.UPPER_BOUND
+            tt.store(key, alpha, best_move, CELLS - moves, node_type)
+        return alpha
+
     # ---------------------------------------------------
     # ITERATIVE DEEPENING
     # ---------------------------------------------------
-    def iterative_deepening(self, board: Board, ctx: SearchContext):
+    def iterative_deepening(self, board: Board, ctx: SearchContext, first_depth=1):
         best_move = None
-        ctx.tt.clear()  # clear TT to store fresh PV moves
+        best_score = 0
+        previous = None
 
-        for d in range(1, ctx.max_depth + 1):
-            move, _ = self.search_root(board, d, ctx)
+        for d in range(first_depth, ctx.max_depth + 1):
+            # Aspiration window around the previous iteration's score
+            if previous is None or not (ctx.use_aspiration and ctx.use_ab):
+                alpha, beta = -10**9, 10**9
+            else:
+                alpha, beta = previous - cc.ASPIRATION_WINDOW, previous + cc.ASPIRATION_WINDOW
+            delta = cc.ASPIRATION_WINDOW
+
+            while True:
+                move, score = self.search_root(board, d, ctx, alpha, beta)
+                if ctx.time_exceeded() or move is None:
+                    break
+                # Widen the failing side and search this depth again
+                if score <= alpha:
+                    alpha = max(-10**9, score - delta)
+                elif score >= beta:
+                    beta = min(10**9, score + delta)
+                else:
+                    break
+                delta *= 4
+
+            ctx.stats.end_iteration(ctx, d, not ctx.time_exceeded())
             if ctx.time_exceeded():
                 break
             if move is not None:
                 best_move = move  # best PV move so far
+                best_score = previous = score
+                ctx.completed_depth = d
 
-        return best_move, 0
+        return best_move, best_score
 
     # ---------------------------------------------------
     # Move Ordering: center-first
@@ -149,3 +614,21 @@ class SearchEngine:
         center = cc.COLS // 2
         return sorted(moves, key=lambda m: abs(m - center))
 
+    # ---------------------------------------------------
+    # Move Ordering: most new winning cells first, center-first on ties
+    # ---------------------------------------------------
+    def order_moves_threats(self, board: Board, moves, player):
+        center = cc.COLS // 2
+        return sorted(moves, key=lambda m: (-board.threats_after(m, player), abs(m - center)))
+
+    # ---------------------------------------------------
+    # Move Ordering: killers + history, center-first on ties
+    # ---------------------------------------------------
+    def order_moves_history(self, board: Board, moves, player, ctx: SearchContext):
+        center = cc.COLS // 2
+        killer1, killer2 = ctx.killers[board.moves]
+        history = ctx.history[player == 1]
+        def key(m):
+            return (m != killer1, m != killer2, -history[m][board.height(m)], abs(m - center))
+        return sorted(moves, key=key)
+
@@ -0,0 +1,92 @@
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass
+class IterationStats:
+    """Counters of one iterative deepening iteration (or one fixed-depth search)"""
+    depth: int
+    completed: bool  # False if the clock ran out during this iteration
+    nodes: int
+    leaf_evals: int
+    tt_probes: int
+    tt_hits: int
+    tt_cutoffs: int  # nodes answered by the table without searching
+    cutoffs: int  # beta cutoffs
+    first_move_cutoffs: int
+    elapsed: float
+    ebf: Optional[float]  # nodes of this iteration / nodes of the previous one
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    @property
+    def nps(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+@dataclass
+class SearchStats:
+    """
+    Per-iteration search statistics for one move, filled in by SearchEngine
+    and kept in ctx.stats. Counters are deltas of the running totals on the
+    context and table since the previous iteration.
+    """
+    iterations: List[IterationStats] = field(default_factory=list)
+    nodes: int = 0
+    elapsed: float = 0.0
+    _last: tuple = None
+    _lap: float = 0.0
+
+    @staticmethod
+    def _counters(ctx):
+        # Endgame solves probe their own table; count it alongside the main one
+        tables = [ctx.tt]
+        if ctx.endgame_tt is not None and ctx.endgame_tt is not ctx.tt:
+            tables.append(ctx.endgame_tt)
+        hits = sum(tt.hits for tt in tables)
+        probes = hits + sum(tt.misses for tt in tables)
+        return (ctx.nodes, ctx.leaf_evals, probes, hits,
+                ctx.tt_cutoffs, ctx.cutoffs, ctx.first_move_cutoffs)
+
+    def start(self, ctx):
+        """Take the baseline for the first iteration."""
+        self._last = self._counters(ctx)
+        self._lap = time.time()
+
+    def end_iteration(self, ctx, depth: int, completed: bool = True):
+        now = self._counters(ctx)
+        nodes, leaf_evals, probes, hits, tt_cutoffs, cutoffs, first = (
+            a - b for a, b in zip(now, self._last))
+        lap = time.time()
+        previous = self.iterations[-1].nodes if self.iterations else 0
+        self.iterations.append(IterationStats(
+            depth, completed, nodes, leaf_evals, probes, hits, tt_cutoffs, cutoffs, first,
+            lap - self._lap, nodes / previous if previous else None))
+        self._last = now
+        self._lap = lap
+
+    def finish(self, ctx):
+        """Record the move's totals (including nodes searched by helpers)."""
+        self.nodes = ctx.nodes
+        self.elapsed = time.time() - ctx.start
+
+    @property
+    def depth(self) -> int:
+        """Deepest completed iteration (0 if none)."""
+        return max((it.depth for it in self.iterations if it.completed), default=0)
+
+    @property
+    def nps(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def report(self) -> str:
+        lines = [f"{'depth':>5} {'nodes':>9} {'leaves':>9} {'probes':>8} {'hits':>8} {'tt cut':>7} "
+                 f"{'cutoffs':>8} {'1st %':>6} {'ebf':>5} {'time':>7} {'nps':>9}"]
+        for it in self.iterations:
+            ebf = f"{it.ebf:5.2f}" if it.ebf is not None else "    -"
+            lines.append(f"{it.depth:>4}{' ' if it.completed else '*'} {it.nodes:>9} {it.leaf_evals:>9} "
+                         f"{it.tt_probes:>8} {it.tt_hits:>8} {it.tt_cutoffs:>7} {it.cutoffs:>8} "
+                         f"{it.first_move_cutoff_rate * 100:>6.1f} {ebf} {it.elapsed:>7.3f} {it.nps:>9.0f}")
+        lines.append(f"total: depth {self.depth}, {self.nodes} nodes in {self.elapsed:.3f}s ({self.nps:.0f} nodes/s)")
+        return "\n".join(lines)
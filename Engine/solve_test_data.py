@@ -0,0 +1,65 @@
+# Engine/solve_test_data.py
+# Check the exact solver against the solved positions in test_data.
+#
+# usage: python -m Engine.solve_test_data [--limit N] test_data/Test_L3_R1 ...
+
+import argparse
+import time
+
+from Engine.board import board_from_moves
+from Engine.search_context import SearchContext
+from Engine.search_engine import SearchEngine
+
+def load_positions(path):
+    """Return [(moves, expected_score)] from a test_data file."""
+    positions = []
+    with open(path) as f:
+        for line in f:
+            line = line.split()
+            if len(line) == 2:
+                positions.append((line[0], int(line[1])))
+    return positions
+
+def check_file(path, engine: SearchEngine, ctx: SearchContext, limit=None):
+    """Solve every position of one file; return a dict of results."""
+    positions = load_positions(path)[:limit]
+    correct = 0
+    nodes = 0
+    probes = 0
+    start = time.time()
+    for moves, expected in positions:
+        ctx.nodes = 0
+        if engine.solve(board_from_moves(moves), ctx) == expected:
+            correct += 1
+        nodes += ctx.nodes
+        probes += ctx.probes
+    elapsed = time.time() - start
+    return {
+        "file": path,
+        "positions": len(positions),
+        "correct": correct,
+        "total_time": elapsed,
+        "mean_time": elapsed / len(positions) if positions else 0,
+        "mean_nodes": nodes / len(positions) if positions else 0,
+        "total_nodes": nodes,
+        "mean_probes": probes / len(positions) if positions else 0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the exact solver against test_data files")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--limit", type=int, default=None, help="only the first N positions of each file")
+    parser.add_argument("--full-window", action="store_true", help="one wide-window search instead of null-window probes")
+    args = parser.parse_args()
+
+    engine = SearchEngine()
+    ctx = SearchContext(time_limit=None, use_solver=True, use_null_window=not args.full_window)
+    for path in args.files:
+        r = check_file(path, engine, ctx, args.limit)
+        print(f"{r['file']}: {r['correct']}/{r['positions']} correct, "
+              f"{r['total_time']:.2f}s total, {r['mean_time'] * 1000:.2f}ms/position, "
+              f"{r['mean_nodes']:.0f} nodes/position ({r['total_nodes']} total), "
+              f"{r['mean_probes']:.1f} probes/position")
+
+if __name__ == "__main__":
+    main()
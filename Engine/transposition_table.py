@@ -1,89 +1,164 @@
-import hashlib
+import mmap
+import os
+from array import array
 from enum import Enum
+from multiprocessing import shared_memory
 from typing import Optional, Tuple
-from Engine.board import Board
+import Engine.config_constants as cc
 
 class NodeType(Enum):
     EXACT = 0      # Exact score
     LOWER_BOUND = 1  # Alpha cutoff (score >= stored value)
     UPPER_BOUND = 2  # Beta cutoff (score <= stored value)
 
-class TranspositionEntry:
-    def __init__(self, score: int, best_move: Optional[int], depth: int, node_type: NodeType):
-        self.score = score
-        self.best_move = best_move
-        self.depth = depth
-        self.node_type = node_type
+# Every entry is two 64-bit words: Board.key XOR the data word, then a packed
+# data word. An entry only matches a key when both words agree, so a reader
+# that races a writer sees a miss rather than another position's data.
+#   bits  0-31  score + SCORE_BIAS
+#   bits 32-35  best move (NO_MOVE if none)
+#   bits 36-43  depth
+#   bits 44-45  node type + 1 (never 0, so an empty slot has a zero data word)
+#   bits 46-53  generation
+# Buckets hold two entries: slot 0 is depth-preferred, slot 1 always-replace.
+ENTRY_WORDS = 2
+BUCKET_WORDS = 2 * ENTRY_WORDS
+BUCKET_BYTES = 8 * BUCKET_WORDS
+
+# Keys are multiplied by KEY_MIX and the bucket taken from the high half of
+# the product, so every key bit reaches the index. The solver's raw
+# position keys would otherwise only be told apart by their low columns.
+KEY_MIX = 0x9E3779B97F4A7C15
+KEY_MASK = (1 << 64) - 1
+
+SCORE_BIAS = 1 << 31
+SCORE_MASK = (1 << 32) - 1
+NO_MOVE = 0xF
+MOVE_SHIFT = 32
+DEPTH_SHIFT = 36
+TYPE_SHIFT = 44
+DEPTH_MASK = 0xFF
+GEN_SHIFT = 46
+GEN_MASK = 0xFF
+
+# Shared tables and table files start with a header of HEADER_WORDS 64-bit
+# words, followed by the buckets exactly as they sit in memory:
+#   word 0  TABLE_MAGIC
+#   word 1  number of buckets
+#   word 2  generation (files only)
+#   word 3  filled entries (files only)
+HEADER_WORDS = 4
+HEADER_BYTES = 8 * HEADER_WORDS
+TABLE_MAGIC = 0x43344254  # "C4BT"
 
 class TranspositionTable:
-    def __init__(self, max_size: int = 1000000):
-        self.table = {}
-        self.max_size = max_size
+    def __init__(self, size_bytes: int = cc.TRANSPOSITION_TABLE_SIZE, slots=None):
+        # 'slots' lets a subclass supply its own storage of 64-bit words
+        if slots is None:
+            slots = array("Q", bytes(max(1, size_bytes // BUCKET_BYTES) * BUCKET_BYTES))
+        self.slots = slots
+        self.num_buckets = len(slots) // BUCKET_WORDS
+        self.mmap = None  # set when the buckets are mapped from a file by load()
+        self.generation = 0
+        self.filled = 0
         self.hits = 0
         self.misses = 0
-    
-    def _hash_board(self, board: Board) -> str:
-        """Create a unique hash for the board position"""
-        board_str = ""
-        for row in range(6):  # ROWS
-            for col in range(7):  # COLS
-                piece = board.grid[row][col]
-                if piece == 1:
-                    board_str += "X"
-                elif piece == -1:
-                    board_str += "O"
-                else:
-                    board_str += "."
-        
-        return hashlib.md5(board_str.encode()).hexdigest()
-    
-    def store(self, board: Board, score: int, best_move: Optional[int], depth: int, node_type: NodeType):
-        """Store position in transposition table"""
-        if len(self.table) >= self.max_size:
-            # Simple replacement: remove oldest entries
-            self._cleanup()
-        
-        key = self._hash_board(board)
-        entry = TranspositionEntry(score, best_move, depth, node_type)
-        self.table[key] = entry
-    
-    def lookup(self, board: Board, depth: int, alpha: int, beta: int) -> Tuple[Optional[int], Optional[int]]:
+
+    def new_search(self):
+        """Advance the generation so entries from earlier searches age out"""
+        self.generation = (self.generation + 1) & GEN_MASK
+
+    def store(self, key: int, score: int, best_move: Optional[int], depth: int, node_type: NodeType):
+        """Store position (by its Board.key) in transposition table"""
+        slots = self.slots
+        i = ((key * KEY_MIX & KEY_MASK) >> 32) % self.num_buckets * BUCKET_WORDS
+        data = ((score + SCORE_BIAS)
+                | (NO_MOVE if best_move is None else best_move) << MOVE_SHIFT
+                | depth << DEPTH_SHIFT
+                | (node_type.value + 1) << TYPE_SHIFT
+                | self.generation << GEN_SHIFT)
+
+        old = slots[i + 1]
+        same = slots[i] ^ old == key
+        if (not old or same
+                or (old >> GEN_SHIFT) & GEN_MASK != self.generation
+                or depth >= (old >> DEPTH_SHIFT) & DEPTH_MASK):
+            # Take the depth-preferred slot, demoting a different position
+            # it held into the always-replace slot
+            if old and not same:
+                if not slots[i + 3]:
+                    self.filled += 1
+                slots[i + 2] = slots[i]
+                slots[i + 3] = old
+            elif not old:
+                self.filled += 1
+            slots[i] = key ^ data
+            slots[i + 1] = data
+        else:
+            if not slots[i + 3]:
+                self.filled += 1
+            slots[i + 2] = key ^ data
+            slots[i + 3] = data
+
+    def lookup(self, key: int, depth: int, alpha: int, beta: int) -> Tuple[Optional[int], Optional[int]]:
         """
         Lookup position in transposition table
         Returns: (score, best_move) or (None, None) if not found/not usable
         """
-        key = self._hash_board(board)
-        
-        if key not in self.table:
+        slots = self.slots
+        i = ((key * KEY_MIX & KEY_MASK) >> 32) % self.num_buckets * BUCKET_WORDS
+        data = slots[i + 1]
+        if slots[i] ^ data != key:
+            data = slots[i + 3]
+            if slots[i + 2] ^ data != key:
+                data = 0
+
+        if not data:
             self.misses += 1
             return None, None
-        
-        entry = self.table[key]
-        
+
+        best_move = (data >> MOVE_SHIFT) & NO_MOVE
+        if best_move >= cc.COLS:
+            best_move = None
+
         # Only use entry if it was searched to at least the same depth
-        if entry.depth < depth:
+        if (data >> DEPTH_SHIFT) & DEPTH_MASK < depth:
             self.misses += 1
-            return None, None
-        
+            return None, best_move
+
         self.hits += 1
-        
+
         # Check if we can use this score based on node type
-        if entry.node_type == NodeType.EXACT:
-            return entry.score, entry.best_move
-        elif entry.node_type == NodeType.LOWER_BOUND and entry.score >= beta:
-            return entry.score, entry.best_move
-        elif entry.node_type == NodeType.UPPER_BOUND and entry.score <= alpha:
-            return entry.score, entry.best_move
-        
+        score = (data & SCORE_MASK) - SCORE_BIAS
+        node_type = (data >> TYPE_SHIFT) & 3
+        if node_type == 1:
+            return score, best_move
+        elif node_type == 2 and score >= beta:
+            return score, best_move
+        elif node_type == 3 and score <= alpha:
+            return score, best_move
+
         # Can't use score, but might be able to use best move for move ordering
-        return None, entry.best_move
-    
-    def _cleanup(self):
-        """Remove half of the entries to make room"""
-        items = list(self.table.items())
-        # Keep the second half (more recent entries)
-        self.table = dict(items[len(items)//2:])
-    
+        return None, best_move
+
+    def probe(self, key: int) -> Optional[Tuple[int, Optional[int], int, NodeType]]:
+        """Raw entry for key as (score, best_move, depth, node_type), or None"""
+        slots = self.slots
+        i = ((key * KEY_MIX & KEY_MASK) >> 32) % self.num_buckets * BUCKET_WORDS
+        data = slots[i + 1]
+        if slots[i] ^ data != key:
+            data = slots[i + 3]
+            if slots[i + 2] ^ data != key:
+                data = 0
+        if not data:
+            self.misses += 1
+            return None
+        self.hits += 1
+        best_move = (data >> MOVE_SHIFT) & NO_MOVE
+        return ((data & SCORE_MASK) - SCORE_BIAS,
+                None if best_move >= cc.COLS else best_move,
+                (data >> DEPTH_SHIFT) & DEPTH_MASK,
+                NodeType(((data >> TYPE_SHIFT) & 3) - 1))
+
     def get_stats(self) -> dict:
         """Get statistics about table performance"""
         total = self.hits + self.misses
@@ -92,11 +167,105 @@ class TranspositionTable:
             "hits": self.hits,
             "misses": self.misses,
             "hit_rate": f"{hit_rate:.1f}%",
-            "table_size": len(self.table)
+            "table_size": self.filled,
+            "capacity": self.num_buckets * 2
         }
-    
+
     def clear(self):
         """Clear the transposition table"""
-        self.table.clear()
+        self.slots[:] = array("Q", bytes(len(self.slots) * 8))
+        self.generation = 0
+        self.filled = 0
         self.hits = 0
         self.misses = 0
+
+    def dump(self, path: str):
+        """
+        Write the table to a binary file that load() maps back in. The file
+        is written beside 'path' and then moved over it, so a table loaded
+        from 'path' can be saved back to it.
+        """
+        header = array("Q", [TABLE_MAGIC, self.num_buckets, self.generation, self.filled])
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(self.slots)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "TranspositionTable":
+        """
+        Open a file written by dump(). The buckets are memory-mapped
+        copy-on-write, so pages are read in as the search touches them and
+        new stores never change the file.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        header = memoryview(mapped)[:HEADER_BYTES].cast("Q")
+        magic, num_buckets, generation, filled = header
+        header.release()
+        if magic != TABLE_MAGIC or len(mapped) != HEADER_BYTES + num_buckets * BUCKET_BYTES:
+            mapped.close()
+            raise ValueError(f"{path!r} is not a transposition table file")
+        tt = TranspositionTable(slots=memoryview(mapped)[HEADER_BYTES:].cast("Q"))
+        tt.mmap = mapped
+        tt.generation = generation
+        tt.filled = filled
+        return tt
+
+    def close(self):
+        """Unmap the file behind a table from load(); no-op otherwise"""
+        if self.mmap is not None:
+            self.slots.release()
+            self.mmap.close()
+            self.mmap = None
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    TranspositionTable whose buckets live in a multiprocessing.shared_memory
+    block, so several processes search into the same table. Create it once,
+    then attach() to it by name from the other processes.
+
+    Writers do not lock. Two processes storing into the same slot at once
+    can leave one entry's key word next to another entry's data word, but
+    the key XOR data check turns such a torn entry into a miss.
+    """
+    def __init__(self, size_bytes: int = cc.TRANSPOSITION_TABLE_SIZE, name: Optional[str] = None):
+        if name is None:
+            num_buckets = max(1, size_bytes // BUCKET_BYTES)
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + num_buckets * BUCKET_BYTES)
+            header = self.shm.buf[:HEADER_BYTES].cast("Q")
+            header[0] = TABLE_MAGIC
+            header[1] = num_buckets
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            header = self.shm.buf[:HEADER_BYTES].cast("Q")
+            num_buckets = header[1]
+            if header[0] != TABLE_MAGIC:
+                header.release()
+                self.shm.close()
+                raise ValueError(f"shared memory block {name!r} is not a transposition table")
+        header.release()
+        self.owner = name is None
+        self._view = self.shm.buf[HEADER_BYTES:HEADER_BYTES + num_buckets * BUCKET_BYTES]
+        super().__init__(slots=self._view.cast("Q"))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTranspositionTable":
+        """Open a table created by another process"""
+        return cls(name=name)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self):
+        """Detach from the block; the creating process also frees it"""
+        if self.shm is None:
+            return
+        self.slots.release()
+        self._view.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
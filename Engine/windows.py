@@ -0,0 +1,67 @@
+# Engine/windows.py
+# Four-cell windows of the board and the score tables used by the evaluation.
+
+import Engine.config_constants as cc
+
+CENTER_WEIGHT = 2 # How important the center is
+
+def window_score(myc: int, opc: int) -> int:
+    """Score of one window holding 'myc' of my discs and 'opc' of the opponent's."""
+    empty = 4 - myc - opc
+
+    if myc == 4:
+        return cc.WIN_SCORE
+    if opc == 4:
+        return cc.LOSS_SCORE
+
+    s = 0
+    if myc == 3 and empty == 1: s += 30
+    if myc == 2 and empty == 2: s += 6
+    if opc == 3 and empty == 1: s -= 35
+    if opc == 2 and empty == 2: s -= 6
+    return s
+
+# Every window as a tuple of 4 (row, col) cells
+WINDOWS = []
+# Horizontal
+for r in range(cc.ROWS):
+    for c in range(cc.COLS-3):
+        WINDOWS.append(tuple((r, c+i) for i in range(4)))
+# Vertical
+for c in range(cc.COLS):
+    for r in range(cc.ROWS-3):
+        WINDOWS.append(tuple((r+i, c) for i in range(4)))
+# Diagonal (\)
+for r in range(cc.ROWS-3):
+    for c in range(cc.COLS-3):
+        WINDOWS.append(tuple((r+i, c+i) for i in range(4)))
+# Diagonal (/)
+for r in range(3, cc.ROWS):
+    for c in range(cc.COLS-3):
+        WINDOWS.append(tuple((r-i, c+i) for i in range(4)))
+
+# Flat grid index (row * COLS + col) of every cell of every window
+WINDOW_CELLS = [tuple(r * cc.COLS + c for r, c in cells) for cells in WINDOWS]
+CENTER_CELLS = [r * cc.COLS + cc.COLS // 2 for r in range(cc.ROWS)]
+
+# Window indices touching each (row, col) cell
+CELL_WINDOWS = [[[] for _ in range(cc.COLS)] for _ in range(cc.ROWS)]
+for w, cells in enumerate(WINDOWS):
+    for r, c in cells:
+        CELL_WINDOWS[r][c].append(w)
+
+# Score of every possible window state, built once. The state is a base-3
+# number whose i-th digit is 0 (empty), 1 (mine) or 2 (opponent) for the
+# window's i-th cell, so a grid value v (1 / -1 / 0) contributes v % 3.
+WINDOW_STATE_SCORES = [window_score(digits.count(1), digits.count(2))
+                       for digits in ([(code // 3**i) % 3 for i in range(4)] for code in range(3**4))]
+
+# A window's counts are encoded as myc * 5 + opc. Adding one of my discs adds
+# 5 to the code and one of the opponent's adds 1; the gain tables give the
+# resulting change in score, indexed by the code before the disc is added.
+WINDOW_SCORES = [window_score(code // 5, code % 5) if code // 5 + code % 5 <= 4 else 0
+                 for code in range(25)]
+MY_GAIN = [WINDOW_SCORES[code + 5] - WINDOW_SCORES[code] if code + 5 < 25 else 0
+           for code in range(25)]
+OPP_GAIN = [WINDOW_SCORES[code + 1] - WINDOW_SCORES[code] if code % 5 < 4 else 0
+            for code in range(25)]